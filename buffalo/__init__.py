@@ -16,7 +16,7 @@ from .exceptions import (BuffaloError, BuffaloFileNotFoundError, FileFormatError
 from .utils import (safe_load_yaml, dump_yaml, read_file, write_file, load_yaml_file, save_yaml_file)
 
 # Import other functions
-from .work import Work
+from .work import Work, Status
 from .project import Project
 from .buffalo import Buffalo
 
@@ -50,6 +50,7 @@ __all__ = [
     "get_template_path",
     "Buffalo",
     "Work",
+    "Status",
     "Project",
 ]
 
@@ -38,7 +38,7 @@ class Buffalo:
             built_in_template = Path(get_template_path())
             if built_in_template.exists():
                 self.template_path = built_in_template
-                logging.warning(f"User template '{template_path}' not found, using built-in template: {built_in_template}")
+                logging.warning("User template '%s' not found, using built-in template: %s", template_path, built_in_template)
             else:
                 raise BuffaloFileNotFoundError(f"Could not find project description file: {self.template_path}")
 
@@ -53,23 +53,23 @@ class Buffalo:
         # Initialize self.projects object, [project name, Project object]
         self.projects: Dict[str, Project] = {}
 
-        logging.info(f"Loading projects from directory {self.base_dir}")
+        logging.info("Loading projects from directory %s", self.base_dir)
         try:
             self.load_projects()
-            logging.info(f"Successfully loaded {len(self.projects)} projects from directory {self.base_dir}")
+            logging.info("Successfully loaded %d projects from directory %s", len(self.projects), self.base_dir)
         except BuffaloError as e:
-            logging.error(f"Failed to load projects from directory {self.base_dir}: {e}")
+            logging.error("Failed to load projects from directory %s: %s", self.base_dir, e)
 
     def load_projects(self) -> None:
         """
         Load all existing projects from the base_dir directory into Buffalo
         """
-        logging.debug(f"Starting to scan {self.base_dir}")
+        logging.debug("Starting to scan %s", self.base_dir)
         # Get first-level subdirectories under base_dir
         for directory in self.base_dir.iterdir():
             if directory.is_dir():
                 if (directory / self.WF_FILE_NAME).exists():
-                    logging.debug(f"Loading project from directory {directory}")
+                    logging.debug("Loading project from directory %s", directory)
                     self.load_project(directory.name)
 
     def load_project(self, project_name: str) -> Optional[Project]:
@@ -103,12 +103,12 @@ class Buffalo:
             if project:
                 return project
 
-            # Create new project
-            project = Project(project_name, self.base_dir, self.template_path)
+            # Create new project, overwriting a project file that could not be loaded
+            project = Project(project_name, self.base_dir, self.template_path, force_reinit=True)
             self.projects[project_name] = project
             return project
         except (ProjectLoadError, ProjectSaveError, ConfigurationError) as e:
-            logging.error(f"Failed to create project {project_name}: {e}")
+            logging.error("Failed to create project %s: %s", project_name, e)
             return None
 
     def get_a_job(self, job_name: str = None, without_check: bool = False) -> Tuple[Optional[Project], Optional[Work]]:
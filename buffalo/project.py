@@ -1,14 +1,349 @@
+import errno
+import functools
+import json
 import logging
+import operator
+import os
+import re
 from pathlib import Path
-from typing import Optional, List, Tuple
-import shutil
+from typing import Optional, Dict, List, Tuple, Type, Union
+import stat
+import sys
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 from .work import Work
 from .exceptions import (ProjectLoadError, ProjectSaveError, BuffaloFileNotFoundError, WorkflowFormatError, ConfigurationError)
-from .utils import load_yaml_file, save_yaml_file
+from .utils import load_yaml_file, save_yaml_file, read_file, write_file, safe_load_yaml
+
+# ioctl request cloning a whole file on copy-on-write filesystems (btrfs, xfs), Linux only
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl is not None and sys.platform.startswith("linux") else None
+
+# A parsed work entry: (index, name, status, comment)
+WorkSpec = Tuple[int, str, str, str]
+
+# Fields every work entry must define, in the order they are reported when missing
+_WORK_FIELDS = ("name", "status", "comment", "index")
+_REQUIRED_WORK_FIELDS = frozenset(_WORK_FIELDS)
+_get_work_fields = operator.itemgetter(*_WORK_FIELDS)
+
+# Folder name validation: invalid characters, a translation table deleting them, and the maximum length
+_INVALID_CHARS = frozenset('<>:"/\\|?*')
+_INVALID_TABLE = str.maketrans("", "", "".join(_INVALID_CHARS))
+_MAX_NAME_LEN = 255
+
+# Project files have a fixed shape, so they are written and read without going through PyYAML when possible
+_FAST_YAML = True
+# Strings that YAML reads back as the same string when written without quotes
+_PLAIN_SCALAR_RE = re.compile(r"[^\W\d][\w.-]*(?: [\w.-]+)*")
+# Plain words that YAML would resolve to booleans or null
+_RESERVED_SCALARS = frozenset(("y", "n", "yes", "no", "true", "false", "on", "off", "null"))
+# Characters that are not safe to write raw inside a double-quoted YAML scalar
+_UNSAFE_QUOTED_RE = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]")
+_INDEX_RE = re.compile(r"0|-?[1-9][0-9]*")
+_WORK_LINE_RE = re.compile(r"(  - |    )(comment|index|name|status): (.*)")
+
+
+def _parse_workflow(yaml_data: dict, file_path: Union[str, Path], error_class: Type[Exception]) -> Tuple[WorkSpec, ...]:
+    """
+    Validate YAML workflow structure and extract work specs sorted by index.
+
+    :param yaml_data: YAML data to validate
+    :param file_path: Path of the YAML file (for error messages)
+    :param error_class: Exception class raised when the structure is invalid
+    :return: Tuple of work specs sorted by index
+    """
+    # Validate YAML structure
+    if "workflow" not in yaml_data:
+        raise error_class(f"Specified file {file_path} does not contain the workflow field")
+
+    yml_workflow = yaml_data["workflow"]
+
+    if "works" not in yml_workflow:
+        raise error_class(f"Specified file {file_path} does not contain the works field")
+
+    # Process works
+    yml_works = yml_workflow["works"]
+    specs: List[WorkSpec] = [None] * len(yml_works)
+    for i, work in enumerate(yml_works):
+        missing = _REQUIRED_WORK_FIELDS - work.keys()
+        if missing:
+            if "name" in missing:
+                raise error_class("Missing name field in work")
+            field = next(field for field in _WORK_FIELDS if field in missing)
+            raise error_class(f"Missing {field} field in work {work['name']}")
+        name, status, comment, index = _get_work_fields(work)
+        try:
+            index = int(index)
+        except (ValueError, TypeError) as e:
+            raise error_class(f"Invalid index value in work {name}: {index}. Index must be an integer.") from e
+        specs[i] = (index, name, status, comment)
+
+    # Sort works by index
+    specs.sort(key=lambda x: x[0])
+    return tuple(specs)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_template_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[WorkSpec, ...]:  # pylint: disable=unused-argument  # cache key only
+    """
+    Load and validate a workflow template, memoized on the file's path, mtime and size.
+
+    mtime_ns and size are only part of the cache key, so that a modified template is parsed again.
+
+    :param path_str: Template file path
+    :param mtime_ns: Modification time of the template file in nanoseconds
+    :param size: Size of the template file in bytes
+    :return: Tuple of work specs sorted by index
+    """
+    return _parse_workflow(load_yaml_file(path_str), path_str, WorkflowFormatError)
+
+
+def _yaml_scalar(value: str) -> Optional[str]:
+    """
+    Format a string as a YAML scalar.
+
+    :param value: String to format
+    :return: Plain or double-quoted scalar, None if the string needs the full YAML emitter
+    """
+    if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in _RESERVED_SCALARS:
+        return value
+    if _UNSAFE_QUOTED_RE.search(value):
+        return None
+    # JSON strings are valid double-quoted YAML scalars
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _parse_yaml_scalar(text: str) -> Optional[str]:
+    """
+    Parse a scalar written by _yaml_scalar.
+
+    :param text: Scalar text
+    :return: The string value, None if the scalar needs the full YAML parser
+    """
+    if _PLAIN_SCALAR_RE.fullmatch(text) and text.lower() not in _RESERVED_SCALARS:
+        return text
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"' and not _UNSAFE_QUOTED_RE.search(text):
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
+    return None
+
+
+def _fast_dump_work(work: Work) -> Optional[str]:
+    """
+    Serialize one work entry of a project file.
+
+    :param work: Work to serialize
+    :return: YAML content of the list item, None if some value needs the full YAML emitter
+    """
+    # bool is an int subclass, but YAML would write it as true/false
+    if not isinstance(work.index, int) or isinstance(work.index, bool):
+        return None
+    values = (work.comment, work.name, work.status)
+    scalars = [_yaml_scalar(value) if isinstance(value, str) else None for value in values]
+    if None in scalars:
+        return None
+    comment, name, status = scalars
+    return f"  - comment: {comment}\n    index: {work.index}\n    name: {name}\n    status: {status}\n"
+
+
+def _fast_dump_project(folder_name: str, works: List[Work]) -> Optional[str]:
+    """
+    Serialize a project in the same layout PyYAML produces for project files.
+
+    :param folder_name: Project folder name
+    :param works: Works of the project
+    :return: YAML content, None if some value needs the full YAML emitter
+    """
+    folder_name = _yaml_scalar(folder_name) if isinstance(folder_name, str) else None
+    if folder_name is None:
+        return None
+    if not works:
+        return f"folder_name: {folder_name}\nworkflow:\n  works: []\n"
+
+    parts = [f"folder_name: {folder_name}\nworkflow:\n  works:\n"]
+    for work in works:
+        part = _fast_dump_work(work)
+        if part is None:
+            return None
+        parts.append(part)
+    return "".join(parts)
+
+
+def _parse_project_header(lines: List[str]) -> Optional[str]:
+    """
+    Parse the header lines of a project file, up to and including the works key.
+
+    :param lines: Lines of the project file
+    :return: The folder name, None if the header needs the full YAML parser
+    """
+    if len(lines) < 3 or not lines[0].startswith("folder_name: ") or lines[1] != "workflow:":
+        return None
+    # An empty works list is written in flow style and must be the last line
+    if not (lines[2] == "  works:" or (lines[2] == "  works: []" and len(lines) == 3)):
+        return None
+    return _parse_yaml_scalar(lines[0][len("folder_name: "):])
+
+
+def _parse_work_lines(lines: List[str]) -> Optional[List[dict]]:
+    """
+    Parse the work entries of a project file.
+
+    :param lines: Lines after the works key
+    :return: List of work dicts, None if a line needs the full YAML parser
+    """
+    works: List[dict] = []
+    for line in lines:
+        match = _WORK_LINE_RE.fullmatch(line)
+        if match is None:
+            return None
+        prefix, key, text = match.groups()
+        if prefix == "  - ":
+            works.append({})
+        elif not works:
+            return None
+
+        if key == "index":
+            value = int(text) if _INDEX_RE.fullmatch(text) else None
+        else:
+            value = _parse_yaml_scalar(text)
+        if value is None:
+            return None
+        works[-1][key] = value
+    return works
+
+
+def _fast_load_project(content: str) -> Optional[dict]:
+    """
+    Parse project file content written by _fast_dump_project, or by PyYAML in the same layout.
+
+    :param content: YAML content
+    :return: Parsed data, None if the content needs the full YAML parser
+    """
+    lines = content.split("\n")
+    if lines and lines[-1] == "":
+        lines.pop()
+
+    folder_name = _parse_project_header(lines)
+    if folder_name is None:
+        return None
+    works = _parse_work_lines(lines[3:])
+    if works is None:
+        return None
+    return {"folder_name": folder_name, "workflow": {"works": works}}
+
+
+def _fast_copyfile(source: str, target: str) -> None:
+    """
+    Copy a file with its metadata, keeping the data copy inside the kernel where possible.
+
+    Tries a reflink first, then copy_file_range, and falls back to shutil.copyfile.
+    Like shutil.copy2, a target that is an existing directory receives the file under its own name.
+
+    :param source: Source file path
+    :param target: Target file path
+    :raises shutil.SameFileError: If source and target are the same file
+    :raises shutil.SpecialFileError: If source or target is not a regular file
+    """
+    import shutil
+    if os.path.isdir(target):
+        target = os.path.join(target, os.path.basename(source))
+    # Check before opening the target, which truncates it
+    if os.path.exists(target) and os.path.samefile(source, target):
+        raise shutil.SameFileError(f"{source!r} and {target!r} are the same file")
+    for path in (source, target):
+        try:
+            mode = os.stat(path).st_mode
+        except FileNotFoundError:
+            continue
+        if not stat.S_ISREG(mode):
+            # Opening a named pipe would block forever
+            raise shutil.SpecialFileError(f"`{path}` is not a regular file")
+
+    try:
+        with open(source, "rb") as fsrc, open(target, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            try:
+                if _FICLONE is None:
+                    raise OSError("reflink not supported")
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            except OSError:
+                if not hasattr(os, "copy_file_range"):
+                    raise
+                # copy_file_range advances both file offsets and returns 0 at end of file
+                while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+                    pass
+    except OSError:
+        shutil.copyfile(source, target)
+    shutil.copystat(source, target)
+
+
+def _fast_copytree(source: str, target: str) -> None:
+    """
+    Recursively copy a directory like shutil.copytree(dirs_exist_ok=True), using _fast_copyfile for files.
+
+    :param source: Source directory path
+    :param target: Target directory path
+    :raises shutil.SameFileError: If source and target are the same directory
+    :raises shutil.SpecialFileError: If the directory contains a file that is not a regular file
+    """
+    import shutil
+    if os.path.exists(target) and os.path.samefile(source, target):
+        raise shutil.SameFileError(f"{source!r} and {target!r} are the same directory")
+    # List the entries before creating the target, which may be inside the source
+    with os.scandir(source) as it:
+        entries = list(it)
+    os.makedirs(target, exist_ok=True)
+    for entry in entries:
+        target_path = os.path.join(target, entry.name)
+        if entry.is_dir():
+            _fast_copytree(entry.path, target_path)
+        else:
+            _fast_copyfile(entry.path, target_path)
+    shutil.copystat(source, target)
+
+
+def _replace_path(source: str, target: str) -> None:
+    """
+    Move a file or directory to target, replacing an existing target.
 
+    A rename is tried first, so on the same filesystem this is a single metadata operation.
+    As with shutil.move, a file moved onto an existing directory is put inside that directory,
+    on the same filesystem and across filesystems alike.
 
-class Project:
+    :param source: Source file or directory path
+    :param target: Target file or directory path
+    :raises shutil.Error: If a file is moved into a directory that already contains an entry with its name
+    """
+    import shutil
+    if not os.path.isdir(source) and os.path.isdir(target):
+        target = os.path.join(target, os.path.basename(source))
+        if os.path.lexists(target):
+            raise shutil.Error(f"Destination path '{target}' already exists")
+
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        replaces_dir = os.path.isdir(source) and os.path.isdir(target)
+        if e.errno == errno.EXDEV:
+            # Different filesystems, the data has to be copied
+            if replaces_dir:
+                shutil.rmtree(target)
+            shutil.move(source, target)
+        elif replaces_dir:
+            # A rename cannot replace a non-empty directory on POSIX, or any directory on Windows
+            shutil.rmtree(target)
+            _replace_path(source, target)
+        else:
+            raise
+
+
+class Project:  # pylint: disable=too-many-instance-attributes
     """
     Project class is used to describe a project, including project folder name and project description file path.
 
@@ -18,21 +353,40 @@ class Project:
     LAST_WORK_IN_PROGRESS = "last_work_in_progress"
     WORKFLOW_FILE_NAME = "buffalo.yml"
 
-    def __init__(self, folder_name: str, base_dir: Path, template_path: Optional[Path] = None):
+    def __init__(self, folder_name: str, base_dir: Path, template_path: Optional[Path] = None, force_reinit: bool = False):
         """
         Initialize a new Project class.
 
+        If template_path is provided and the project directory already contains a project file,
+        the saved project is loaded instead of the template, unless force_reinit is True.
+
         :param folder_name: Project folder name (must be a valid folder name)
         :param base_dir: Project base directory
         :param template_path: Template file path, optional for loading existing projects
+        :param force_reinit: Whether to recreate the project from the template even if a project file exists
         :raises ConfigurationError: If the project folder name is not a valid folder name
+        :raises ProjectLoadError: If loading the existing project file fails
         :raises ProjectSaveError: If saving the project file fails
         """
         # Initialize basic attributes
         self.folder_name: str = ""
         self.works: List[Work] = []
-        self.project_path: Optional[Path] = None
+        # Name to Work index, with the list and length of self.works it was built from
+        self._by_name: Dict[str, Work] = {}
+        self._by_name_key: Tuple[Optional[List[Work]], int] = (None, 0)
+        self._project_path: Optional[Path] = None
+        # Project file path as a string, kept in sync with project_path
+        self._workflow_file: Optional[str] = None
+        # Whether the project directory is known to exist
+        self._project_dir_ready: bool = False
         self.template_path: Optional[Path] = template_path
+        # Unsaved status changes, and nesting depth of "with project:" blocks batching the writes
+        self._dirty: bool = False
+        self._batch_depth: int = 0
+        # (current work, next not started work, next not started work if the previous one is done, all done)
+        self._state_cache: Optional[Tuple[Optional[Work], Optional[Work], Optional[Work], bool]] = None
+        # Status version and works the cached state was computed from
+        self._state_key: Tuple[int, Tuple[Work, ...]] = (-1, ())
 
         # Validate project folder name first
         if not self._is_valid_folder_name(folder_name):
@@ -46,13 +400,39 @@ class Project:
         # Load workflow description if template_path is provided
         if template_path and self.project_path:
             # Create project directory if it doesn't exist
-            self.project_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_project_dir()
+
+            # Keep the progress of an existing project instead of resetting it from the template
+            if not force_reinit and os.path.exists(self._workflow_file):
+                self._load_saved_project()
+                return
 
             self._load_yaml_file(template_path)
 
             # Save project file
             self.save_project()
 
+    @property
+    def project_path(self) -> Optional[Path]:
+        """
+        Project directory path, None if the project has no base directory
+        """
+        return self._project_path
+
+    @project_path.setter
+    def project_path(self, project_path: Optional[Path]) -> None:
+        self._project_path = project_path
+        self._workflow_file = os.fspath(project_path / self.WORKFLOW_FILE_NAME) if project_path else None
+        self._project_dir_ready = False
+
+    def _ensure_project_dir(self) -> None:
+        """
+        Create the project directory if it doesn't exist, only touching the filesystem the first time
+        """
+        if not self._project_dir_ready:
+            self.project_path.mkdir(parents=True, exist_ok=True)
+            self._project_dir_ready = True
+
     @classmethod
     def load(cls, folder_name: str, base_dir: Path) -> Optional['Project']:
         """
@@ -72,11 +452,10 @@ class Project:
             project = cls(folder_name, base_dir)
 
             # Load saved project
-            saved_project_file_path = project.project_path / project.WORKFLOW_FILE_NAME
-            project._load_yaml_file(saved_project_file_path, require_folder_name=True)
+            project._load_saved_project()
             return project
         except (ProjectLoadError, BuffaloFileNotFoundError) as e:
-            logging.error(f"Failed to load project {folder_name}: {e}")
+            logging.error("Failed to load project %s: %s", folder_name, e)
             return None
 
     def get_work_by_name(self, work_name: str, without_check: bool = False) -> Optional[Work]:
@@ -94,33 +473,88 @@ class Project:
         """
         if without_check:
             # Directly find work by name
-            for work in self.works:
-                if work.name == work_name:
-                    return work
-        else:
-            # Get next not started work
-            work = self.get_next_not_started_work()
-            if work is not None and work.name == work_name:
-                return work
+            return self._find_work(work_name)
+
+        # Get next not started work
+        work = self.get_next_not_started_work()
+        if work is not None and work.name == work_name:
+            return work
         return None
 
+    def _rebuild_name_index(self) -> None:
+        """
+        Rebuild the name to Work index from self.works
+        """
+        self._by_name = {}
+        for work in self.works:
+            # Keep the first work when names are duplicated, as a linear search would
+            self._by_name.setdefault(work.name, work)
+        self._by_name_key = (self.works, len(self.works))
+
+    def _find_work(self, work_name: str) -> Optional[Work]:
+        """
+        Find the first work with the given name.
+
+        self.works is a public list, so the index is rebuilt when the list was replaced or resized,
+        and a miss falls back to a linear search in case a work was renamed or replaced in place.
+
+        :param work_name: Name of the work to find
+        :return: Work object if found, None otherwise
+        """
+        indexed_works, indexed_len = self._by_name_key
+        if indexed_works is not self.works or indexed_len != len(self.works):
+            self._rebuild_name_index()
+
+        work = self._by_name.get(work_name)
+        if work is None:
+            work = next((w for w in self.works if w.name == work_name), None)
+            if work is not None:
+                self._rebuild_name_index()
+        return work
+
+    def __enter__(self) -> 'Project':
+        """
+        Start batching status updates, the project file is written once when the outermost block exits.
+
+        :return: The project itself
+        """
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
     def update_work_status(self, work: Work, status: str) -> None:
         """
         Update work status and save project.
 
+        Inside a "with project:" block the save is deferred until the block exits.
+
         :param work: Work object to update
         :param status: New status
         :raises ProjectSaveError: If saving the project file fails
         """
         # Verify work belongs to this project
-        if not any(w.name == work.name for w in self.works):
+        if self._find_work(work.name) is not work and not any(w is work for w in self.works):
             return
 
         # Update status
         work.set_status(status)
+        self._dirty = True
 
-        # Save project
-        if self.project_path:
+        # Save project unless updates are being batched
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Save project to file if there are unsaved status updates
+
+        :raises ProjectSaveError: If saving the project file fails
+        """
+        if self._dirty and self.project_path:
             self.save_project()
 
     @staticmethod
@@ -136,71 +570,80 @@ class Project:
             return False
 
         # Check if name contains invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        if any(char in name for char in invalid_chars):
+        if len(name.translate(_INVALID_TABLE)) != len(name):
             return False
 
         # Check if name starts or ends with a dot or space
-        if name.startswith('.') or name.endswith('.') or name.startswith(' ') or name.endswith(' '):
+        first, last = name[0], name[-1]
+        if first == '.' or last == '.' or first == ' ' or last == ' ':
             return False
 
         # Check if name is too long (Windows has a 255 character limit for paths)
-        if len(name) > 255:
+        if len(name) > _MAX_NAME_LEN:
             return False
 
         return True
 
-    def _process_yaml_workflow(self, yaml_data: dict, file_path: Path, require_folder_name: bool = False) -> None:
+    def _process_yaml_workflow(self, specs: Tuple[WorkSpec, ...]) -> None:
         """
-        Validate YAML file structure and process works.
+        Create Work objects from validated work specs, replacing the current works.
 
-        :param yaml_data: YAML data to validate
-        :param file_path: Path of the YAML file (for error messages)
-        :param require_folder_name: Whether this is a project file (True) or workflow file (False)
-        :raises WorkflowFormatError: If workflow file structure is invalid
-        :raises ProjectLoadError: If project file structure is invalid
+        :param specs: Work specs sorted by index
+        :raises WorkStatusError: If a work has an invalid status
         """
-        error_class = ProjectLoadError if require_folder_name else WorkflowFormatError
+        self.works = [None] * len(specs)
+        for i, (index, name, status, comment) in enumerate(specs):
+            work_obj = Work(index=index, name=name, comment=comment)
+            work_obj.set_status(status)
+            self.works[i] = work_obj
+        self._rebuild_name_index()
+        self._invalidate_state()
+
+    def _invalidate_state(self) -> None:
+        """
+        Drop the cached workflow state, it is recomputed on the next query
+        """
+        self._state_cache = None
 
-        # Validate YAML structure
-        if "workflow" not in yaml_data:
-            raise error_class(f"Specified file {file_path} does not contain the workflow field")
+    def _compute_state(self) -> Tuple[Optional[Work], Optional[Work], Optional[Work], bool]:
+        """
+        Compute the workflow state in a single pass over the works and cache it.
 
-        yml_workflow = yaml_data["workflow"]
+        The cached state is reused only while no work status has changed and self.works holds the same works
+        in the same order, so replacing, adding, removing or reordering works is always seen.
 
-        if "works" not in yml_workflow:
-            raise error_class(f"Specified file {file_path} does not contain the works field")
+        :return: Tuple of (current work, next not started work, next not started work if the previous work is done, all done)
+        """
+        state_key = (Work.status_version(), tuple(self.works))
+        if self._state_cache is not None and state_key == self._state_key:
+            return self._state_cache
+
+        current_work = None
+        next_work = None
+        next_checked_work = None
+        all_done = True
+        is_last_work_done = True
 
-        # Process works
-        work_count = 0
-        for work in yml_workflow["works"]:
-            if "name" not in work:
-                raise error_class("Missing name field in work")
-            if "status" not in work:
-                raise error_class(f"Missing status field in work {work['name']}")
-            if "comment" not in work:
-                raise error_class(f"Missing comment field in work {work['name']}")
-            if "index" not in work:
-                raise error_class(f"Missing index field in work {work['name']}")
-            try:
-                index = int(work["index"])
-            except (ValueError, TypeError) as e:
-                raise error_class(f"Invalid index value in work {work['name']}: {work['index']}. Index must be an integer.") from e
-            work_count += 1
-            # Create Work object
-            work_obj = Work(
-                index=index,
-                name=work["name"],
-                comment=work["comment"],
-            )
-            if "status" in work:
-                work_obj.set_status(work["status"])
-            self.works.append(work_obj)
-
-        # Sort works by index
-        self.works.sort(key=lambda x: x.index)
-
-    def _load_yaml_file(self, file_path: Path, require_folder_name: bool = False) -> None:
+        for work in self.works:
+            if work.is_in_progress():
+                if current_work is None:
+                    current_work = work
+            elif work.is_not_started() and next_work is None:
+                next_work = work
+                # done, or this is the first work of the project
+                if is_last_work_done:
+                    next_checked_work = work
+
+            if not work.is_done():
+                all_done = False
+            # Assign the is_done status of current work to is_last_work_done
+            is_last_work_done = work.is_done()
+
+        self._state_cache = (current_work, next_work, next_checked_work, all_done)
+        self._state_key = state_key
+        return self._state_cache
+
+    def _load_yaml_file(self, file_path: Union[str, Path], require_folder_name: bool = False) -> None:
         """
         Load and process a YAML file.
 
@@ -210,21 +653,30 @@ class Project:
         :raises ProjectLoadError: If loading or processing the project file fails
         :raises BuffaloFileNotFoundError: If the file does not exist
         """
-        if not file_path.exists():
+        if not os.path.exists(file_path):
             raise BuffaloFileNotFoundError(f"Specified file does not exist: {file_path}")
 
         try:
-            # Load YAML file
-            yaml_data = load_yaml_file(str(file_path))
-
-            # Process folder_name if required
             if require_folder_name:
+                # Load YAML file
+                content = read_file(os.fspath(file_path))
+                yaml_data = _fast_load_project(content) if _FAST_YAML else None
+                if yaml_data is None:
+                    yaml_data = safe_load_yaml(content)
+
+                # Process folder_name
                 if "folder_name" not in yaml_data:
                     raise ProjectLoadError(f"File {file_path} does not contain the folder_name field")
                 self.folder_name = yaml_data["folder_name"]
 
+                specs = _parse_workflow(yaml_data, file_path, ProjectLoadError)
+            else:
+                # Templates are shared between projects, so reuse the parsed result while the file is unchanged
+                stat_result = os.stat(file_path)
+                specs = _load_template_cached(os.fspath(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+
             # Process YAML workflow
-            self._process_yaml_workflow(yaml_data, file_path, require_folder_name)
+            self._process_yaml_workflow(specs)
 
         except Exception as e:
             if isinstance(e, (WorkflowFormatError, ProjectLoadError, BuffaloFileNotFoundError)):
@@ -237,11 +689,10 @@ class Project:
 
         :raises ProjectLoadError: If loading the project file fails
         """
-        if not self.project_path:
+        if not self._workflow_file:
             raise ProjectLoadError("Project path not set")
 
-        saved_project_file_path = self.project_path / self.WORKFLOW_FILE_NAME
-        self._load_yaml_file(saved_project_file_path, require_folder_name=True)
+        self._load_yaml_file(self._workflow_file, require_folder_name=True)
 
     def save_project(self):
         """
@@ -249,24 +700,34 @@ class Project:
 
         :raises ProjectSaveError: If saving the project file fails
         """
-        if not self.project_path:
+        if not self._workflow_file:
             raise ProjectSaveError("Project path not set")
 
-        # Organize data
-        works_dict = []
-        for work in self.works:
-            works_dict.append({
-                "name": work.name,
-                "status": work.status,
-                "comment": work.comment,
-                "index": work.index,
-            })
-
-        # Use utility function to save YAML file
+        # Write to a temporary file first and then replace the project file, so it is never left half written
+        project_file_path = self._workflow_file
+        tmp_file_path = project_file_path + ".tmp"
         try:
-            save_yaml_file(str(self.project_path / self.WORKFLOW_FILE_NAME), {"folder_name": self.folder_name, "workflow": {"works": works_dict}})
+            yaml_content = _fast_dump_project(self.folder_name, self.works) if _FAST_YAML else None
+            if yaml_content is not None:
+                write_file(tmp_file_path, yaml_content)
+            else:
+                # Organize data
+                works_dict = [{
+                    "name": work.name,
+                    "status": work.status,
+                    "comment": work.comment,
+                    "index": work.index,
+                } for work in self.works]
+                save_yaml_file(tmp_file_path, {"folder_name": self.folder_name, "workflow": {"works": works_dict}})
+            os.replace(tmp_file_path, project_file_path)
         except Exception as e:
+            # Don't leave a partially written temporary file behind
+            try:
+                os.remove(tmp_file_path)
+            except OSError:
+                pass
             raise ProjectSaveError(f"Failed to save project file: {e}") from e
+        self._dirty = False
 
     def get_current_work(self) -> Optional[Work]:
         """
@@ -274,10 +735,7 @@ class Project:
 
         :return: Current work; if current work doesn't exist, returns None
         """
-        for work in self.works:
-            if work.is_in_progress():
-                return work
-        return None
+        return self._compute_state()[0]
 
     def get_next_not_started_work(self, without_check: bool = False) -> Optional[Work]:
         """
@@ -290,26 +748,8 @@ class Project:
         :param without_check: Whether to skip checking the status of previous works
         :return: Returns the next not started work; if no such work exists, returns None
         """
-        # Return the next not started work
-        is_last_work_done = True
-
-        for work in self.works:
-            if work.is_not_started():
-                if without_check:
-                    # Just return the current work
-                    return work
-                else:
-                    # Should check if the last work is done
-                    if is_last_work_done:
-                        # done, or this is the first work of the project
-                        return work
-                    else:
-                        return None
-
-            # Assign the is_done status of current work to is_last_work_done
-            is_last_work_done = work.is_done()
-
-        return None
+        _, next_work, next_checked_work, _ = self._compute_state()
+        return next_work if without_check else next_checked_work
 
     def is_all_done(self) -> bool:
         """
@@ -317,11 +757,7 @@ class Project:
 
         :return: True if all works are done, False otherwise
         """
-        # Check if all works are done
-        for work in self.works:
-            if not work.is_done():
-                return False
-        return True
+        return self._compute_state()[3]
 
     def __str__(self) -> str:
         output = f"""Project:
@@ -342,14 +778,20 @@ class Project:
         :raises PermissionError: If there are insufficient permissions for the copy operation
         :raises ValueError: If the target name is invalid
         """
+        # shutil is only needed here, keep it out of the package import time
+        import shutil
+
         if not self.project_path:
             raise ProjectLoadError("Project path not set")
 
-        if not source_path.exists():
-            raise FileNotFoundError(f"Source path does not exist: {source_path}")
+        # A single stat call both checks existence and tells the file type
+        try:
+            source_mode = os.stat(source_path).st_mode
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Source path does not exist: {source_path}") from e
 
         # Ensure project directory exists
-        self.project_path.mkdir(parents=True, exist_ok=True)
+        self._ensure_project_dir()
 
         # Use custom target name if provided, otherwise use source name
         target = self.project_path / (target_name if target_name else source_path.name)
@@ -359,10 +801,10 @@ class Project:
             raise ValueError(f"Invalid target name: {target_name}. Name must be a valid file/folder name.")
 
         try:
-            if source_path.is_file():
-                shutil.copy2(source_path, target)
-            elif source_path.is_dir():
-                shutil.copytree(source_path, target, dirs_exist_ok=True)
+            if stat.S_ISREG(source_mode):
+                _fast_copyfile(os.fspath(source_path), os.fspath(target))
+            elif stat.S_ISDIR(source_mode):
+                _fast_copytree(os.fspath(source_path), os.fspath(target))
             else:
                 raise ValueError(f"Unsupported file type: {source_path}")
         except (shutil.Error, OSError) as e:
@@ -378,14 +820,20 @@ class Project:
         :raises PermissionError: If there are insufficient permissions for the move operation
         :raises ValueError: If the target name is invalid
         """
+        # shutil is only needed here, keep it out of the package import time
+        import shutil
+
         if not self.project_path:
             raise ProjectLoadError("Project path not set")
 
-        if not source_path.exists():
-            raise FileNotFoundError(f"Source path does not exist: {source_path}")
+        # A single stat call both checks existence and tells the file type
+        try:
+            source_mode = os.stat(source_path).st_mode
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Source path does not exist: {source_path}") from e
 
         # Ensure project directory exists
-        self.project_path.mkdir(parents=True, exist_ok=True)
+        self._ensure_project_dir()
 
         # Use custom target name if provided, otherwise use source name
         target = self.project_path / (target_name if target_name else source_path.name)
@@ -395,13 +843,8 @@ class Project:
             raise ValueError(f"Invalid target name: {target_name}. Name must be a valid file/folder name.")
 
         try:
-            if source_path.is_file():
-                shutil.move(source_path, target)
-            elif source_path.is_dir():
-                # If target directory exists, remove it first
-                if target.exists():
-                    shutil.rmtree(target)
-                shutil.move(source_path, target)
+            if stat.S_ISREG(source_mode) or stat.S_ISDIR(source_mode):
+                _replace_path(os.fspath(source_path), os.fspath(target))
             else:
                 raise ValueError(f"Unsupported file type: {source_path}")
         except (shutil.Error, OSError) as e:
@@ -4,13 +4,30 @@ Buffalo Utility Module
 Provides common utility functions, such as safe YAML handling and file operations
 """
 
+import functools
+import logging
 from typing import Any, Dict
 
-import yaml
-
 from .exceptions import FileFormatError
 
 
+@functools.lru_cache(maxsize=None)
+def _yaml_backend():
+    """
+    Import PyYAML on first use, preferring the libyaml C bindings when PyYAML was built with them
+
+    :return: Tuple of (yaml module, Loader class, Dumper class)
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+
+    logging.debug("Using YAML backend: %s/%s", loader.__name__, dumper.__name__)
+    return yaml, loader, dumper
+
+
 def safe_load_yaml(yaml_string: str) -> Dict[str, Any]:
     """
     Safely load YAML string
@@ -21,8 +38,9 @@ def safe_load_yaml(yaml_string: str) -> Dict[str, Any]:
     Returns:
         Parsed YAML content
     """
+    yaml, loader, _ = _yaml_backend()
     try:
-        return yaml.safe_load(yaml_string) or {}
+        return yaml.load(yaml_string, Loader=loader) or {}
     except yaml.YAMLError as e:
         raise FileFormatError(f"Unable to parse YAML content: {e}") from e
 
@@ -37,8 +55,9 @@ def dump_yaml(data: Dict[str, Any]) -> str:
     Returns:
         YAML format string
     """
+    yaml, _, dumper = _yaml_backend()
     try:
-        return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        return yaml.dump(data, Dumper=dumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
     except yaml.YAMLError as e:
         raise FileFormatError(f"Unable to convert to YAML string: {e}") from e
 
@@ -81,9 +100,11 @@ def load_yaml_file(file_path: str) -> Dict[str, Any]:
     :return: YAML content
     :raises FileFormatError: If file cannot be read or parsed
     """
-    content = read_file(file_path)
+    yaml, loader, _ = _yaml_backend()
     try:
-        return yaml.safe_load(content)
+        # The YAML reader decodes UTF-8 itself, so read bytes in large chunks instead of decoding in text mode first
+        with open(file_path, "rb", buffering=1 << 17) as f:
+            return yaml.load(f, Loader=loader)
     except yaml.YAMLError as e:
         raise FileFormatError(f"Cannot parse YAML file: {file_path}") from e
 
@@ -96,5 +117,10 @@ def save_yaml_file(file_path: str, data: Dict[str, Any]) -> None:
     :param data: Data to save
     :raises FileFormatError: If file cannot be written
     """
-    yaml_content = yaml.dump(data, default_flow_style=False, allow_unicode=True)
-    write_file(file_path, yaml_content)
+    yaml, _, dumper = _yaml_backend()
+    try:
+        # Stream straight into the file instead of building the whole YAML string first
+        with open(file_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
+    except Exception as e:
+        raise FileFormatError(f"Cannot write file: {file_path}") from e
@@ -1,6 +1,19 @@
+from enum import IntEnum
+from typing import Optional, Union
+
 from .exceptions import WorkStatusError
 
 
+class Status(IntEnum):
+    """
+    Integer codes of the work statuses, used for fast status checks
+    """
+
+    NOT_STARTED = 0
+    IN_PROGRESS = 1
+    DONE = 2
+
+
 class Work:
     """
     Work class is used to describe a work unit, including work name, work status, and work description
@@ -13,6 +26,9 @@ class Work:
     IN_PROGRESS = "in_progress"
     DONE = "done"
 
+    # Incremented whenever the status of any work changes, so that state derived from statuses can be cached
+    _status_version: int = 0
+
     def __init__(self, index: int, name: str, comment: str):
         """
         Initialize a Work object
@@ -26,6 +42,30 @@ class Work:
         self.status: str = Work.NOT_STARTED
         self.comment: str = comment
 
+    @property
+    def status(self) -> str:
+        """
+        Work status, one of NOT_STARTED, IN_PROGRESS, DONE
+        """
+        return self._status
+
+    @status.setter
+    def status(self, status: Union[str, Status]) -> None:
+        if isinstance(status, Status):
+            status = _STATUS_NAMES[status]
+        self._status = status
+        self._status_code: Optional[Status] = _STATUS_CODES.get(status)
+        Work._status_version += 1
+
+    @staticmethod
+    def status_version() -> int:
+        """
+        Return a counter that changes whenever the status of any work changes
+
+        :return: Current status version
+        """
+        return Work._status_version
+
     def __str__(self) -> str:
         """
         Return string representation of Work object
@@ -34,14 +74,14 @@ class Work:
         """
         return f"Work(index={self.index}, name={self.name}, status={self.status}, comment={self.comment})"
 
-    def set_status(self, status: str) -> None:
+    def set_status(self, status: Union[str, Status]) -> None:
         """
         Set work status
         
-        :param status: Work status, must be one of NOT_STARTED, IN_PROGRESS, DONE
+        :param status: Work status, must be one of NOT_STARTED, IN_PROGRESS, DONE, or a Status code
         :raises WorkStatusError: Raised when status is not one of the three predefined statuses
         """
-        if status not in [Work.NOT_STARTED, Work.IN_PROGRESS, Work.DONE]:
+        if not isinstance(status, Status) and status not in _STATUS_CODES:
             raise WorkStatusError(f"Invalid work status: {status}")
         self.status = status
 
@@ -51,7 +91,7 @@ class Work:
         
         :return: Returns True if work status is DONE, otherwise returns False
         """
-        return self.status == Work.DONE
+        return self._status_code == Status.DONE
 
     def is_not_started(self) -> bool:
         """
@@ -59,7 +99,7 @@ class Work:
         
         :return: Returns True if work status is NOT_STARTED, otherwise returns False
         """
-        return self.status == Work.NOT_STARTED
+        return self._status_code == Status.NOT_STARTED
 
     def is_in_progress(self) -> bool:
         """
@@ -67,4 +107,13 @@ class Work:
         
         :return: Returns True if work status is IN_PROGRESS, otherwise returns False
         """
-        return self.status == Work.IN_PROGRESS
+        return self._status_code == Status.IN_PROGRESS
+
+
+# Mapping between the status names stored in project files and their integer codes
+_STATUS_CODES = {
+    Work.NOT_STARTED: Status.NOT_STARTED,
+    Work.IN_PROGRESS: Status.IN_PROGRESS,
+    Work.DONE: Status.DONE,
+}
+_STATUS_NAMES = {code: name for name, code in _STATUS_CODES.items()}
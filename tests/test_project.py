@@ -1,10 +1,12 @@
+import os
 import sys
 from pathlib import Path
 import shutil
 import pytest
 
-from buffalo.project import Project, ProjectLoadError
-from buffalo.work import Work
+from buffalo.exceptions import WorkflowFormatError, WorkStatusError
+from buffalo.project import Project, ProjectLoadError, ProjectSaveError
+from buffalo.work import Status, Work
 
 
 @pytest.fixture(name="project")
@@ -88,6 +90,51 @@ def test_copy_dir_with_custom_name(project, files):
     assert (target_dir / "subdir" / "subfile.txt").read_text() == "subfile content"
 
 
+def test_copy_file_onto_itself(project, files):
+    # Test copying a project file onto itself keeps its content
+    project.copy_to_project(files / "test.txt")
+    target_file = project.project_path / "test.txt"
+    with pytest.raises(ProjectSaveError):
+        project.copy_to_project(target_file)
+    assert target_file.read_text() == "test content"
+
+
+def test_copy_dir_onto_itself(project, files):
+    # Test copying a project directory onto itself keeps its files
+    project.copy_to_project(files)
+    target_dir = project.project_path / "test_files"
+    with pytest.raises(ProjectSaveError):
+        project.copy_to_project(target_dir)
+    assert (target_dir / "test.txt").read_text() == "test content"
+    assert (target_dir / "subdir" / "subfile.txt").read_text() == "subfile content"
+
+
+def test_copy_dir_into_own_subdir(project, files):
+    # Test copying the project directory into a subdirectory of itself copies it only once
+    project.copy_to_project(files / "test.txt")
+    project.copy_to_project(project.project_path, "backup")
+
+    backup_dir = project.project_path / "backup"
+    assert (backup_dir / "test.txt").read_text() == "test content"
+    assert not (backup_dir / "backup").exists()
+
+
+def test_copy_file_into_existing_dir(project, files):
+    # Test copying a file onto an existing directory of the same name puts it inside the directory
+    target_dir = project.project_path / "test.txt"
+    target_dir.mkdir()
+    project.copy_to_project(files / "test.txt")
+    assert (target_dir / "test.txt").read_text() == "test content"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Named pipes are not supported")
+def test_copy_dir_with_named_pipe(project, files):
+    # Test copying a directory containing a named pipe fails instead of blocking
+    os.mkfifo(files / "pipe")
+    with pytest.raises(ProjectSaveError):
+        project.copy_to_project(files)
+
+
 def test_move_file_to_project(project, files):
     # Test moving a single file
     source_file = files / "test.txt"
@@ -136,6 +183,29 @@ def test_move_dir_with_custom_name(project, files):
     assert not files.exists()
 
 
+def test_move_dir_replaces_existing_dir(project, files):
+    # Test moving a directory onto an existing non-empty directory
+    target_dir = project.project_path / "test_files"
+    target_dir.mkdir()
+    (target_dir / "old.txt").write_text("old content")
+
+    project.move_to_project(files)
+
+    # Verify the existing directory was replaced
+    assert (target_dir / "test.txt").exists()
+    assert not (target_dir / "old.txt").exists()
+    assert not files.exists()
+
+
+def test_move_file_into_existing_dir(project, files):
+    # Test moving a file onto an existing directory of the same name puts it inside the directory
+    target_dir = project.project_path / "test.txt"
+    target_dir.mkdir()
+    project.move_to_project(files / "test.txt")
+    assert (target_dir / "test.txt").read_text() == "test content"
+    assert not (files / "test.txt").exists()
+
+
 def test_copy_nonexistent_file(project):
     # Test copying non-existent file
     with pytest.raises(FileNotFoundError):
@@ -366,5 +436,294 @@ def test_get_next_not_started_work():
             shutil.rmtree(base_dir)
 
 
+def test_template_cache_reloads_modified_template():
+    """Test that projects share a parsed template until the template file changes"""
+    template_content = """workflow:
+  works:
+    - name: "Work 1"
+      status: not_started
+      comment: "First work"
+      index: 1
+"""
+    base_dir = Path("test_temp")
+    base_dir.mkdir(exist_ok=True)
+    template_path = base_dir / "test_template.yml"
+    template_path.write_text(template_content)
+
+    try:
+        project_a = Project("project_a", base_dir, template_path)
+        project_b = Project("project_b", base_dir, template_path)
+
+        # Work objects must not be shared between projects
+        assert project_a.works[0] is not project_b.works[0]
+        project_a.works[0].set_status(Work.DONE)
+        assert project_b.works[0].is_not_started()
+
+        # Modify the template, the next project must see the new works
+        template_path.write_text(template_content + """    - name: "Work 2"
+      status: not_started
+      comment: "Second work"
+      index: 2
+""")
+        project_c = Project("project_c", base_dir, template_path)
+        assert [work.name for work in project_c.works] == ["Work 1", "Work 2"]
+
+    finally:
+        # Clean up
+        if base_dir.exists():
+            shutil.rmtree(base_dir)
+
+
+def test_template_missing_work_field():
+    """Test that a work without a required field is rejected with the name of the field"""
+    template_content = """workflow:
+  works:
+    - name: "Work 1"
+      status: not_started
+      index: 1
+"""
+    base_dir = Path("test_temp")
+    base_dir.mkdir(exist_ok=True)
+    template_path = base_dir / "test_template.yml"
+    template_path.write_text(template_content)
+
+    try:
+        with pytest.raises(WorkflowFormatError, match="Missing comment field in work Work 1"):
+            Project("test_project", base_dir, template_path)
+
+    finally:
+        # Clean up
+        if base_dir.exists():
+            shutil.rmtree(base_dir)
+
+
+def test_batch_status_updates():
+    """Test that status updates inside a with block are saved once when the block exits"""
+    template_content = """workflow:
+  works:
+    - name: "Work 1"
+      status: not_started
+      comment: "First work"
+      index: 1
+"""
+    base_dir = Path("test_temp")
+    base_dir.mkdir(exist_ok=True)
+    template_path = base_dir / "test_template.yml"
+    template_path.write_text(template_content)
+
+    try:
+        project = Project("test_project", base_dir, template_path)
+        assert project.project_path is not None
+        project_file = project.project_path / project.WORKFLOW_FILE_NAME
+        work = project.works[0]
+
+        with project:
+            project.update_work_status(work, Work.IN_PROGRESS)
+            assert "status: not_started" in project_file.read_text(encoding="utf-8")
+            project.update_work_status(work, Work.DONE)
+
+        assert "status: done" in project_file.read_text(encoding="utf-8")
+        assert not (project.project_path / (project.WORKFLOW_FILE_NAME + ".tmp")).exists()
+
+        # Outside a with block updates are saved immediately
+        project.update_work_status(work, Work.NOT_STARTED)
+        assert "status: not_started" in project_file.read_text(encoding="utf-8")
+
+    finally:
+        # Clean up
+        if base_dir.exists():
+            shutil.rmtree(base_dir)
+
+
+def test_workflow_state_follows_status_changes():
+    """Test that current work and all done state follow status changes of the works"""
+    template_content = """workflow:
+  works:
+    - name: "Work 1"
+      status: not_started
+      comment: "First work"
+      index: 1
+    - name: "Work 2"
+      status: not_started
+      comment: "Second work"
+      index: 2
+"""
+    base_dir = Path("test_temp")
+    base_dir.mkdir(exist_ok=True)
+    template_path = base_dir / "test_template.yml"
+    template_path.write_text(template_content)
+
+    try:
+        project = Project("test_project", base_dir, template_path)
+        assert project.get_current_work() is None
+        assert not project.is_all_done()
+
+        project.update_work_status(project.works[0], Work.IN_PROGRESS)
+        assert project.get_current_work() is project.works[0]
+
+        project.works[0].set_status(Work.DONE)
+        assert project.get_current_work() is None
+        assert project.get_next_not_started_work() is project.works[1]
+
+        project.works[1].status = Work.DONE
+        assert project.get_next_not_started_work() is None
+        assert project.is_all_done()
+
+    finally:
+        # Clean up
+        if base_dir.exists():
+            shutil.rmtree(base_dir)
+
+
+def test_work_status_codes():
+    """Test that work status accepts both status names and Status codes"""
+    work = Work(index=1, name="Work 1", comment="First work")
+    assert work.is_not_started()
+
+    work.set_status(Status.IN_PROGRESS)
+    assert work.status == Work.IN_PROGRESS
+    assert work.is_in_progress()
+
+    work.set_status(Work.DONE)
+    assert work.is_done()
+
+    with pytest.raises(WorkStatusError):
+        work.set_status("finished")
+    with pytest.raises(WorkStatusError):
+        work.set_status(2)
+
+
+def test_save_and_load_special_strings(project: Project):
+    """Test that comments needing quotes or the full YAML emitter survive a save and load"""
+    comments = ["yes", "123", "a: b # c", " padded ", "", "line\nbreak", "next\x85line", "测试：注释"]
+    for i, comment in enumerate(comments, start=1):
+        project.works.append(Work(index=i, name=f"Work {i}", comment=comment))
+    project.save_project()
+
+    loaded_project = Project.load("test_project", project.project_path.parent)
+    assert loaded_project is not None
+    assert [work.comment for work in loaded_project.works] == comments
+
+
+def test_reinit_keeps_saved_progress():
+    """Test that creating a project over an existing project file keeps its progress unless force_reinit is set"""
+    template_content = """workflow:
+  works:
+    - name: "Work 1"
+      status: not_started
+      comment: "First work"
+      index: 1
+"""
+    base_dir = Path("test_temp")
+    base_dir.mkdir(exist_ok=True)
+    template_path = base_dir / "test_template.yml"
+    template_path.write_text(template_content)
+
+    try:
+        project = Project("test_project", base_dir, template_path)
+        project.update_work_status(project.works[0], Work.DONE)
+
+        # The saved project file is loaded instead of the template
+        project = Project("test_project", base_dir, template_path)
+        assert project.works[0].is_done()
+
+        # force_reinit recreates the project from the template
+        project = Project("test_project", base_dir, template_path, force_reinit=True)
+        assert project.works[0].is_not_started()
+        reloaded_project = Project.load("test_project", base_dir)
+        assert reloaded_project is not None
+        assert reloaded_project.works[0].is_not_started()
+
+    finally:
+        # Clean up
+        if base_dir.exists():
+            shutil.rmtree(base_dir)
+
+
+def test_find_appended_and_duplicate_works(project: Project):
+    """Test that works appended to the works list, including duplicate names, can be found and updated"""
+    first_work = Work(index=1, name="Work 1", comment="First work")
+    duplicate_work = Work(index=2, name="Work 1", comment="Duplicate work")
+    project.works.append(first_work)
+    project.works.append(duplicate_work)
+
+    assert project.get_work_by_name("Work 1", without_check=True) is first_work
+
+    project.update_work_status(duplicate_work, Work.DONE)
+    assert duplicate_work.is_done()
+
+    loaded_project = Project.load("test_project", project.project_path.parent)
+    assert loaded_project is not None
+    assert loaded_project.works[1].is_done()
+
+    # A work replaced in place is found through the linear search fallback
+    replaced_work = Work(index=3, name="Work 3", comment="Third work")
+    project.works[1] = replaced_work
+    assert project.get_work_by_name("Work 3", without_check=True) is replaced_work
+
+
+def test_workflow_state_follows_works_list_changes(project: Project):
+    """Test that the cached workflow state notices works added to or removed from the works list"""
+    first_work = Work(index=1, name="Work 1", comment="First work")
+    project.works.append(first_work)
+    first_work.set_status(Work.DONE)
+    assert project.is_all_done()
+
+    second_work = Work(index=2, name="Work 2", comment="Second work")
+    project.works.append(second_work)
+    assert not project.is_all_done()
+    assert project.get_next_not_started_work() is second_work
+
+    # Status changes of the appended work are seen as well
+    second_work.set_status(Work.IN_PROGRESS)
+    assert project.get_current_work() is second_work
+    assert project.get_next_not_started_work() is None
+
+    project.works.pop()
+    assert project.get_current_work() is None
+    assert project.is_all_done()
+
+    project.works = [Work(index=1, name="Work 1", comment="First work")]
+    assert not project.is_all_done()
+
+
+def test_workflow_state_follows_in_place_works_changes(project: Project):
+    """Test that the cached workflow state notices works replaced or reordered in place"""
+    for i in range(1, 5):
+        project.works.append(Work(index=i, name=f"Work {i}", comment=f"Work number {i}"))
+    assert project.get_current_work() is None
+    assert project.get_next_not_started_work(without_check=True).index == 1
+
+    # Replace a work in place
+    replaced_work = Work(index=1, name="Work 1", comment="Replaced work")
+    replaced_work.set_status(Work.IN_PROGRESS)
+    project.works[0] = replaced_work
+    assert project.get_current_work() is replaced_work
+    assert project.get_next_not_started_work(without_check=True).index == 2
+
+    # Reorder the works in place
+    project.works.sort(key=lambda w: -w.index)
+    assert project.get_next_not_started_work(without_check=True).index == 4
+
+
+def test_failed_save_removes_temporary_file(project: Project, monkeypatch):
+    """Test that a failed save leaves neither a temporary file nor a modified project file behind"""
+    project.save_project()
+    project_file = project.project_path / project.WORKFLOW_FILE_NAME
+    content = project_file.read_text(encoding="utf-8")
+
+    def failing_write_file(file_path, file_content):
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(file_content[:5])
+        raise OSError("disk full")
+
+    monkeypatch.setattr("buffalo.project.write_file", failing_write_file)
+    with pytest.raises(ProjectSaveError):
+        project.save_project()
+
+    assert not (project.project_path / (project.WORKFLOW_FILE_NAME + ".tmp")).exists()
+    assert project_file.read_text(encoding="utf-8") == content
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main([__file__] + sys.argv[1:]))